@@ -1,17 +1,32 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import gzip
+import io
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Set
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Literal, Optional, Set
 
-from fastapi import Depends, FastAPI, File, Form, HTTPException, UploadFile
+import orjson
+from fastapi import Depends, FastAPI, File, Form, HTTPException, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, ORJSONResponse, RedirectResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
-from .storage import get_resume_store, get_local_resume_store, ResumeStore, LocalResumeStore
+from .storage import (
+    get_resume_store,
+    get_local_resume_store,
+    ResumeStore,
+    LocalResumeStore,
+    COPY_CHUNK_SIZE,
+    PRESIGNED_URL_EXPIRES,
+    RESUME_CACHE_CONTROL,
+)
 
-app = FastAPI(title='Scholarship & Resume API', version='1.0.0')
+app = FastAPI(
+    title='Scholarship & Resume API',
+    version='1.0.0',
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -133,8 +148,59 @@ MOCK_SCHOLARSHIPS: List[Scholarship] = [
     ),
 ]
 
+# 목 데이터는 로드 이후 변하지 않으므로 조회용 인덱스를 한 번만 생성
+SCHOLARSHIPS_BY_ID: Dict[str, Scholarship] = {s.id: s for s in MOCK_SCHOLARSHIPS}
+SCHOLARSHIPS_BY_CATEGORY: Dict[str, List[Scholarship]] = {
+    category: [s for s in MOCK_SCHOLARSHIPS if s.category == category]
+    for category in ('scholarship', 'competition')
+}
+SCHOLARSHIP_IDS: FrozenSet[str] = frozenset(SCHOLARSHIPS_BY_ID)
+
+# 응답 본문도 항목별로 미리 직렬화해 요청마다 Pydantic 검증/직렬화를 생략
+_SCHOLARSHIP_JSON_BY_ID: Dict[str, bytes] = {s.id: orjson.dumps(s.model_dump()) for s in MOCK_SCHOLARSHIPS}
+
+
+def _json_array(blobs: Iterable[bytes]) -> bytes:
+    """직렬화된 JSON 항목들을 하나의 JSON 배열로 결합"""
+    return b'[' + b','.join(blobs) + b']'
+
+
+_SCHOLARSHIPS_JSON_ALL: bytes = _json_array(_SCHOLARSHIP_JSON_BY_ID[s.id] for s in MOCK_SCHOLARSHIPS)
+_SCHOLARSHIPS_JSON_BY_CATEGORY: Dict[str, bytes] = {
+    category: _json_array(_SCHOLARSHIP_JSON_BY_ID[s.id] for s in scholarships)
+    for category, scholarships in SCHOLARSHIPS_BY_CATEGORY.items()
+}
+
 SAVED_SCHOLARSHIP_IDS: Set[str] = set()
 
+PDF_MAGIC = b'%PDF-'
+MAX_META_BYTES = 64 * 1024
+
+
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Accept-Encoding 헤더가 gzip을 허용하는지 확인 (헤더가 없으면 압축하지 않음)"""
+    if not accept_encoding:
+        return False
+    for token in accept_encoding.split(','):
+        coding, _, params = token.strip().partition(';')
+        if coding.strip().lower() not in ('gzip', '*'):
+            continue
+        name, _, value = params.strip().partition('=')
+        if name.strip().lower() == 'q':
+            try:
+                return float(value) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+def _iter_gunzip(path: Path) -> Iterator[bytes]:
+    """gzip으로 저장된 파일을 청크 단위로 풀어서 반환"""
+    with gzip.open(path, 'rb') as f:
+        while chunk := f.read(COPY_CHUNK_SIZE):
+            yield chunk
+
 
 @app.post('/api/students/{student_id}/resume', response_model=ResumeResponse)
 async def upload_resume(
@@ -147,27 +213,45 @@ async def upload_resume(
     if file.content_type != 'application/pdf':
         raise HTTPException(status_code=400, detail='Only PDF uploads are allowed.')
 
+    # 바이트 기준으로 제한 (한글은 문자당 3바이트)
+    # 이 검사 시점에는 폼 필드가 이미 메모리에 올라와 있으므로 파싱 비용만 막아줌.
+    # 수신 자체를 제한하려면 멀티파트 파서 단계의 파트 크기 제한이 필요함 (Starlette 0.37에는 없음)
+    meta_bytes = meta.encode()
+    if len(meta_bytes) > MAX_META_BYTES:
+        raise HTTPException(status_code=413, detail='`meta` is too large.')
+
     try:
-        meta_dict: Dict[str, Any] = json.loads(meta) if meta else {}
-    except json.JSONDecodeError:
+        meta_dict: Dict[str, Any] = orjson.loads(meta_bytes) if meta_bytes else {}
+    except orjson.JSONDecodeError:
         raise HTTPException(status_code=400, detail='`meta` must be valid JSON.')
+    if not isinstance(meta_dict, dict):
+        raise HTTPException(status_code=400, detail='`meta` must be a JSON object.')
 
-    content = await file.read()
-    if not content:
+    # 본문 전체를 읽지 않고 앞부분(PDF 시그니처)만 확인한 뒤, 스풀 파일을 저장소로 그대로 스트리밍
+    head = await file.read(len(PDF_MAGIC))
+    if not head:
         raise HTTPException(status_code=400, detail='Uploaded file is empty.')
+    if head != PDF_MAGIC:
+        raise HTTPException(status_code=400, detail='Uploaded file is not a valid PDF.')
+    await file.seek(0)
 
     # TODO: PDF 파싱 로직 구현
-    # parsed_data = parse_pdf(content)
+    # parsed_data = parse_pdf(file.file)
     # meta_dict에 파싱된 데이터 추가 가능
     
     meta_dict['source'] = 'upload'  # 업로드 방식 표시
     
     # AWS 리소스가 있으면 사용, 없으면 로컬 저장소 사용
+    # boto3/파일 I/O는 블로킹이므로 스레드풀에서 실행해 이벤트 루프를 막지 않음
     if store is not None:
-        record = store.save_resume(student_id, file.filename or 'resume.pdf', content, meta_dict)
+        record = await asyncio.to_thread(
+            store.save_resume, student_id, file.filename or 'resume.pdf', file.file, meta_dict
+        )
     else:
         local_store = get_local_resume_store()
-        record = local_store.save_resume(student_id, file.filename or 'resume.pdf', content, meta_dict)
+        record = await asyncio.to_thread(
+            local_store.save_resume, student_id, file.filename or 'resume.pdf', file.file, meta_dict
+        )
     
     return ResumeResponse(**record)  # type: ignore[arg-type]
 
@@ -207,17 +291,14 @@ async def write_resume(
     
     # 빈 PDF 생성 (또는 텍스트만 저장)
     # 실제 구현에서는 입력 데이터를 기반으로 PDF를 생성해야 함
-    from uuid import uuid4
-    resume_id = uuid4().hex
-    stored_filename = f"{resume_id}.pdf"
-    
     # 임시로 빈 바이트 배열 사용 (실제로는 입력 데이터를 PDF로 변환)
     empty_pdf_content = b'%PDF-1.4\n'  # 최소한의 PDF 헤더
     
-    record = local_store.save_resume(
+    record = await asyncio.to_thread(
+        local_store.save_resume,
         student_id,
         f"resume_{data.name}.pdf",
-        empty_pdf_content,
+        io.BytesIO(empty_pdf_content),
         meta_dict
     )
     
@@ -229,10 +310,10 @@ async def get_resume(student_id: str, store: Optional[ResumeStore] = Depends(get
     try:
         # AWS 리소스가 있으면 사용, 없으면 로컬 저장소 사용
         if store is not None:
-            record = store.get_resume(student_id)
+            record = await asyncio.to_thread(store.get_resume, student_id)
         else:
             local_store = get_local_resume_store()
-            record = local_store.get_resume(student_id)
+            record = await asyncio.to_thread(local_store.get_resume, student_id)
         return ResumeResponse(**record)
     except HTTPException:
         raise
@@ -242,49 +323,88 @@ async def get_resume(student_id: str, store: Optional[ResumeStore] = Depends(get
 
 
 @app.get('/api/resume-files/{student_id}/{stored_filename}')
-async def download_resume(student_id: str, stored_filename: str, store: Optional[ResumeStore] = Depends(get_resume_store)):
+async def download_resume(
+    request: Request,
+    student_id: str,
+    stored_filename: str,
+    store: Optional[ResumeStore] = Depends(get_resume_store),
+):
     # AWS 리소스가 있으면 사용, 없으면 로컬 저장소 사용
     if store is not None:
-        stream = store.get_resume_stream(student_id, stored_filename)
-        headers = {'Content-Disposition': f'attachment; filename="{stored_filename}"'}
-        return StreamingResponse(stream, media_type='application/pdf', headers=headers)
+        # 파일 본문은 서버를 거치지 않고 S3에서 직접 내려받도록 리다이렉트
+        # 리다이렉트는 서명 URL이 만료되기 전까지만 브라우저에 캐시되도록 함
+        url = await asyncio.to_thread(store.presign_download, student_id, stored_filename)
+        return RedirectResponse(
+            url,
+            status_code=307,
+            headers={'Cache-Control': f'private, max-age={PRESIGNED_URL_EXPIRES - 60}'},
+        )
     else:
         local_store = get_local_resume_store()
-        file_path = local_store.get_resume_stream(student_id, stored_filename)
+
+        # 파일명(이력서 ID)별 내용은 불변이므로 ID를 ETag로 사용하고,
+        # 현재 이력서 파일이 맞는 경우에만 파일 조회 없이 304 반환
+        etag = f'"{stored_filename.split(".", 1)[0]}"'
+        if_none_match = request.headers.get('if-none-match')
+        if (
+            if_none_match
+            and etag in (tag.strip() for tag in if_none_match.split(','))
+            and local_store.is_current_file(student_id, stored_filename)
+        ):
+            return Response(
+                status_code=304,
+                headers={'ETag': etag, 'Cache-Control': RESUME_CACHE_CONTROL, 'Vary': 'Accept-Encoding'},
+            )
+
+        file_path = await asyncio.to_thread(local_store.get_resume_stream, student_id, stored_filename)
+        headers = {
+            'Content-Disposition': f'attachment; filename="{stored_filename}"',
+            'ETag': etag,
+            'Cache-Control': RESUME_CACHE_CONTROL,
+            'Vary': 'Accept-Encoding',
+        }
+        if file_path.suffix == '.gz':
+            if not _accepts_gzip(request.headers.get('accept-encoding')):
+                # gzip을 받지 않는 클라이언트에는 풀어서 원본 PDF로 전송
+                return StreamingResponse(_iter_gunzip(file_path), media_type='application/pdf', headers=headers)
+            headers['Content-Encoding'] = 'gzip'
         return FileResponse(
             path=str(file_path),
             media_type='application/pdf',
             filename=stored_filename,
-            headers={'Content-Disposition': f'attachment; filename="{stored_filename}"'}
+            headers=headers
         )
 
 
 @app.get('/api/scholarships', response_model=List[Scholarship])
-async def list_scholarships(category: Optional[str] = None) -> List[Scholarship]:
-    if category not in (None, 'scholarship', 'competition'):
-        raise HTTPException(status_code=400, detail='Invalid category filter.')
+async def list_scholarships(category: Optional[str] = None) -> Response:
+    # Response를 직접 반환하면 response_model은 문서화에만 쓰이고 검증은 생략됨
+    if category is None:
+        return Response(content=_SCHOLARSHIPS_JSON_ALL, media_type='application/json')
 
-    if category:
-        return [s for s in MOCK_SCHOLARSHIPS if s.category == category]
-    return MOCK_SCHOLARSHIPS
+    body = _SCHOLARSHIPS_JSON_BY_CATEGORY.get(category)
+    if body is None:
+        raise HTTPException(status_code=400, detail='Invalid category filter.')
+    return Response(content=body, media_type='application/json')
 
 
 @app.get('/api/scholarships/{scholarship_id}', response_model=Scholarship)
-async def get_scholarship(scholarship_id: str) -> Scholarship:
-    for scholarship in MOCK_SCHOLARSHIPS:
-        if scholarship.id == scholarship_id:
-            return scholarship
-    raise HTTPException(status_code=404, detail='Scholarship not found.')
+async def get_scholarship(scholarship_id: str) -> Response:
+    body = _SCHOLARSHIP_JSON_BY_ID.get(scholarship_id)
+    if body is None:
+        raise HTTPException(status_code=404, detail='Scholarship not found.')
+    return Response(content=body, media_type='application/json')
 
 
 @app.get('/api/scholarships/saved', response_model=List[Scholarship])
-async def get_saved_scholarships() -> List[Scholarship]:
-    return [s for s in MOCK_SCHOLARSHIPS if s.id in SAVED_SCHOLARSHIP_IDS]
+async def get_saved_scholarships() -> Response:
+    body = _json_array(_SCHOLARSHIP_JSON_BY_ID[s.id] for s in MOCK_SCHOLARSHIPS if s.id in SAVED_SCHOLARSHIP_IDS)
+    return Response(content=body, media_type='application/json')
 
 
 @app.post('/api/scholarships/{scholarship_id}/save', response_model=SaveResponse)
 async def save_scholarship(scholarship_id: str) -> SaveResponse:
-    if scholarship_id not in {s.id for s in MOCK_SCHOLARSHIPS}:
+    if scholarship_id not in SCHOLARSHIP_IDS:
         raise HTTPException(status_code=404, detail='Scholarship not found.')
 
     SAVED_SCHOLARSHIP_IDS.add(scholarship_id)
@@ -1,18 +1,214 @@
 from __future__ import annotations
 
-import json
+import base64
+import gzip
+import math
 import os
-from datetime import datetime, timezone
+import shutil
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Optional, Set, Tuple
 from uuid import uuid4
 
 import boto3
+import orjson
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 from fastapi import HTTPException
-from botocore.response import StreamingBody
 from fastapi.responses import FileResponse
 
+# 업로드 파일을 통째로 메모리에 올리지 않고 이 크기 단위로 복사
+COPY_CHUNK_SIZE = 1 << 20
+
+# 저장 시 gzip 압축 수준 (CPU 사용량과 압축률의 절충)
+GZIP_COMPRESS_LEVEL = 3
+
+# 저장된 이력서 파일은 ID별로 내용이 바뀌지 않으므로 장기 캐시 허용 (로컬 저장소 응답)
+# 개인 이력서이므로 공유 캐시(프록시/CDN)에는 저장되지 않도록 private 지정
+RESUME_CACHE_CONTROL = 'private, max-age=31536000, immutable'
+
+# S3 다운로드용 서명 URL 유효 시간(초)
+PRESIGNED_URL_EXPIRES = 300
+
+# 메타데이터 로그가 이 크기를 넘으면 metadata.json 스냅샷으로 압축
+METADATA_LOG_COMPACT_BYTES = 10 * 1024 * 1024
+
+# 업로드 스트림(_GzipStream)은 시크가 불가능해 s3transfer가 파트를 메모리에 읽어 두고 전송함.
+# 메모리에 대기하는 파트 수를 max_in_memory_upload_chunks로 제한하므로 업로드당 버퍼는
+# 약 multipart_chunksize * max_in_memory_upload_chunks (8 MiB * 4) 이내이며,
+# 한도에 도달하면 다음 read()(= 압축)가 전송 완료를 기다림
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True,
+)
+# boto3 TransferConfig 생성자는 이 값을 인자로 받지 않으므로 속성으로 지정
+_TRANSFER_CONFIG.max_in_memory_upload_chunks = 4
+
+# 워커 전체가 하나의 세션/클라이언트를 공유해 커넥션 풀과 자격증명 조회를 재사용
+# 세션과 리소스 객체는 스레드 안전하지 않으므로 클라이언트 생성은 잠금 안에서 한 번만 하고,
+# DynamoDB도 리소스 대신 스레드 안전한 저수준 클라이언트를 사용
+_SESSION = boto3.session.Session()
+_CLIENT_LOCK = threading.Lock()
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 3, 'mode': 'adaptive'},
+)
+# 업로드가 진행되는 동안 현재 이력서 ID(GetItem)를 미리 조회하기 위한 스레드풀
+# 짧은 조회 하나만 실행하므로 작게 유지 (모두 사용 중이면 조회가 잠시 대기할 뿐 업로드는 계속 진행)
+_METADATA_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='resume-metadata')
+_S3_CLIENT: Optional[Any] = None
+_DYNAMODB_CLIENT: Optional[Any] = None
+
+
+# (초 단위 epoch, 해당 초의 포맷 문자열) 캐시 - 튜플 한 번의 대입으로 교체되어 스레드 간 공유 가능
+_TIMESTAMP_CACHE: Tuple[int, str] = (-1, '')
+
+
+def _format_utc_timestamp(now: float) -> str:
+    """epoch 초를 `datetime.fromtimestamp(now, timezone.utc).isoformat()`과 같은 문자열로 변환
+
+    초 단위 부분은 초가 바뀔 때만 다시 포맷하고, 마이크로초만 매번 붙임.
+    datetime과 마찬가지로 마이크로초는 반올림(half-even)하고, 0이면 소수부를 생략함
+    """
+    global _TIMESTAMP_CACHE
+    fraction, whole = math.modf(now)
+    seconds = int(whole)
+    micros = round(fraction * 1_000_000)
+    if micros >= 1_000_000:
+        seconds += 1
+        micros -= 1_000_000
+    cached_seconds, prefix = _TIMESTAMP_CACHE
+    if seconds != cached_seconds:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+        _TIMESTAMP_CACHE = (seconds, prefix)
+    if micros:
+        return f"{prefix}.{micros:06d}+00:00"
+    return f"{prefix}+00:00"
+
+
+def _utc_timestamp() -> str:
+    """현재 UTC 시각을 ISO 8601 문자열로 반환 (`datetime.now(timezone.utc).isoformat()` 대체)"""
+    return _format_utc_timestamp(time.time())
+
+
+def _new_resume_id() -> str:
+    """22자 URL-safe base64 이력서 ID 생성 (uuid4 hex 32자 대비 단축)"""
+    return base64.urlsafe_b64encode(uuid4().bytes).rstrip(b'=').decode()
+
+
+def _gzip_copy(src: BinaryIO, dst: BinaryIO) -> None:
+    """src를 청크 단위로 읽어 gzip 압축하여 dst에 기록"""
+    with gzip.GzipFile(fileobj=dst, mode='wb', compresslevel=GZIP_COMPRESS_LEVEL) as gz:
+        shutil.copyfileobj(src, gz, COPY_CHUNK_SIZE)
+
+
+class _GzipStream:
+    """src를 읽는 만큼만 gzip 압축해 돌려주는 시크 불가 스트림
+
+    upload_fileobj가 파트 단위로 read()할 때마다 필요한 만큼만 압축하므로
+    압축과 업로드가 겹쳐 진행되고, 압축본 전체를 임시 파일에 쓰지 않음
+    """
+
+    def __init__(self, src: BinaryIO) -> None:
+        self._src = src
+        self._compressor = zlib.compressobj(GZIP_COMPRESS_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        self._buffer = bytearray()
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            chunk = self._src.read(COPY_CHUNK_SIZE)
+            if chunk:
+                self._buffer += self._compressor.compress(chunk)
+            else:
+                self._buffer += self._compressor.flush()
+                self._eof = True
+
+        if size < 0 or size >= len(self._buffer):
+            data = bytes(self._buffer)
+            self._buffer.clear()
+        else:
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+        return data
+
+
+def _to_record(item: Dict[str, Any]) -> Dict[str, Any]:
+    """저장된 항목에서 API 응답용 필드만 추출"""
+    record = {'resumeId': item['resumeId'], 'fileName': item['fileName'], 'url': item['url']}
+    meta = item.get('meta')
+    if meta is not None:
+        record['meta'] = meta
+    return record
+
+
+def _is_conditional_check_failure(exc: ClientError) -> bool:
+    return exc.response.get('Error', {}).get('Code') == 'ConditionalCheckFailedException'
+
+
+def _get_s3_client() -> Any:
+    """공유 S3 클라이언트 반환 (최초 호출 시 생성)"""
+    global _S3_CLIENT
+    with _CLIENT_LOCK:
+        if _S3_CLIENT is None:
+            _S3_CLIENT = _SESSION.client('s3', config=_CLIENT_CONFIG)
+        return _S3_CLIENT
+
+
+def _get_dynamodb_client() -> Any:
+    """공유 DynamoDB 클라이언트 반환 (최초 호출 시 생성)"""
+    global _DYNAMODB_CLIENT
+    with _CLIENT_LOCK:
+        if _DYNAMODB_CLIENT is None:
+            _DYNAMODB_CLIENT = _SESSION.client('dynamodb', config=_CLIENT_CONFIG)
+        return _DYNAMODB_CLIENT
+
+
+class _DynamoTable:
+    """저수준 DynamoDB 클라이언트 위에 Table 리소스와 같은 형태의 get_item/put_item 제공
+
+    값 변환(TypeSerializer/TypeDeserializer)만 하므로 여러 스레드에서 공유해도 안전함
+    """
+
+    def __init__(self, client: Any, table_name: str) -> None:
+        self._client = client
+        self._table_name = table_name
+        self._serializer = TypeSerializer()
+        self._deserializer = TypeDeserializer()
+
+    def _serialize(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: self._serializer.serialize(v) for k, v in values.items()}
+
+    def get_item(self, Key: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+        response = self._client.get_item(TableName=self._table_name, Key=self._serialize(Key), **kwargs)
+        item = response.get('Item')
+        if item is not None:
+            response['Item'] = {k: self._deserializer.deserialize(v) for k, v in item.items()}
+        return response
+
+    def put_item(
+        self,
+        Item: Dict[str, Any],
+        ExpressionAttributeValues: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        if ExpressionAttributeValues is not None:
+            kwargs['ExpressionAttributeValues'] = self._serialize(ExpressionAttributeValues)
+        return self._client.put_item(TableName=self._table_name, Item=self._serialize(Item), **kwargs)
+
 
 class ResumeStore:
     def __init__(self) -> None:
@@ -21,9 +217,9 @@ class ResumeStore:
         if not self.bucket_name:
             raise RuntimeError('RESUME_BUCKET_NAME environment variable must be set.')
 
-        self.dynamodb = boto3.resource('dynamodb')
-        self.table = self.dynamodb.Table(self.table_name)
-        self.s3 = boto3.client('s3')
+        self.dynamodb = _get_dynamodb_client()
+        self.table = _DynamoTable(self.dynamodb, self.table_name)
+        self.s3 = _get_s3_client()
 
     def _build_download_url(self, student_id: str, stored_filename: str) -> str:
         return f"/api/resume-files/{student_id}/{stored_filename}"
@@ -42,29 +238,50 @@ class ResumeStore:
             raise HTTPException(status_code=404, detail='Resume not found for this student.')
         return item
 
+    def _upload_compressed(self, fileobj: BinaryIO, storage_key: str) -> None:
+        """gzip 압축하면서 Content-Encoding: gzip 객체로 업로드"""
+        self.s3.upload_fileobj(
+            _GzipStream(fileobj),
+            self.bucket_name,
+            storage_key,
+            ExtraArgs={'ContentType': 'application/pdf', 'ContentEncoding': 'gzip'},
+            Config=_TRANSFER_CONFIG,
+        )
+
+    def _get_current_resume_id(self, student_id: str) -> Optional[str]:
+        """현재 저장된 이력서 ID 조회 (없으면 None)"""
+        response = self.table.get_item(
+            Key={'studentId': student_id},
+            ProjectionExpression='resumeId',
+            ConsistentRead=True,
+        )
+        existing = response.get('Item')
+        return existing['resumeId'] if existing else None
+
+    def _put_item_if_unchanged(self, item: Dict[str, Any], current_resume_id: Optional[str]) -> None:
+        """읽어 둔 이력서 ID가 그대로인 경우에만 기록 (낙관적 동시성 제어)"""
+        if current_resume_id is None:
+            self.table.put_item(Item=item, ConditionExpression='attribute_not_exists(studentId)')
+        else:
+            self.table.put_item(
+                Item=item,
+                ConditionExpression='attribute_not_exists(studentId) OR resumeId = :old',
+                ExpressionAttributeValues={':old': current_resume_id},
+            )
+
     def save_resume(
         self,
         student_id: str,
         filename: str,
-        content: bytes,
+        fileobj: BinaryIO,
         meta: Optional[Dict[str, object]] = None,
     ) -> Dict[str, Any]:
         if not filename.lower().endswith('.pdf'):
             raise HTTPException(status_code=400, detail='Only PDF uploads are allowed.')
 
-        resume_id = uuid4().hex
+        resume_id = _new_resume_id()
         stored_filename = f"{resume_id}.pdf"
-        storage_key = self._get_storage_key(student_id, stored_filename)
-
-        try:
-            self.s3.put_object(
-                Bucket=self.bucket_name,
-                Key=storage_key,
-                Body=content,
-                ContentType='application/pdf',
-            )
-        except (ClientError, BotoCoreError) as exc:
-            raise HTTPException(status_code=500, detail='Failed to upload resume to storage.') from exc
+        storage_key = f"{student_id}/{stored_filename}"
 
         item: Dict[str, Any] = {
             'studentId': student_id,
@@ -72,23 +289,44 @@ class ResumeStore:
             'fileName': filename,
             'url': self._build_download_url(student_id, stored_filename),
             'storageKey': storage_key,
-            'uploadedAt': datetime.now(timezone.utc).isoformat(),
+            'uploadedAt': _utc_timestamp(),
         }
         if meta:
             item['meta'] = meta
 
+        # 현재 이력서 ID 조회를 업로드와 겹쳐 실행하고, 메타데이터는 객체 업로드가 끝난 뒤에만 기록
+        current = _METADATA_EXECUTOR.submit(self._get_current_resume_id, student_id)
+
         try:
-            self.table.put_item(Item=item)
+            self._upload_compressed(fileobj, storage_key)
+        except (ClientError, BotoCoreError, OSError, ValueError) as exc:
+            # OSError/ValueError: 압축 중 디스크 오류, 이미 닫힌 업로드 파일 등
+            raise HTTPException(status_code=500, detail='Failed to upload resume to storage.') from exc
+
+        try:
+            self._put_item_if_unchanged(item, current.result())
         except (ClientError, BotoCoreError) as exc:
+            # 기록되지 못한 업로드 객체 삭제
+            try:
+                self.s3.delete_object(Bucket=self.bucket_name, Key=storage_key)
+            except Exception:
+                # 정리 실패가 원래의 409/500 응답을 가리지 않도록 무시
+                pass
+            if isinstance(exc, ClientError) and _is_conditional_check_failure(exc):
+                raise HTTPException(
+                    status_code=409,
+                    detail='Resume was updated concurrently. Please retry.',
+                ) from exc
             raise HTTPException(status_code=500, detail='Failed to store resume metadata.') from exc
 
-        return {k: item.get(k) for k in ('resumeId', 'fileName', 'url', 'meta') if item.get(k) is not None}
+        return _to_record(item)
 
     def get_resume(self, student_id: str) -> Dict[str, Any]:
         item = self._fetch_item(student_id)
-        return {k: item.get(k) for k in ('resumeId', 'fileName', 'url', 'meta') if item.get(k) is not None}
+        return _to_record(item)
 
-    def get_resume_stream(self, student_id: str, stored_filename: str) -> StreamingBody:
+    def presign_download(self, student_id: str, stored_filename: str, expires: int = PRESIGNED_URL_EXPIRES) -> str:
+        """S3 객체에 직접 접근하는 서명된 다운로드 URL 반환"""
         item = self._fetch_item(student_id)
         expected_key = item.get('storageKey')
         requested_key = self._get_storage_key(student_id, stored_filename)
@@ -97,15 +335,18 @@ class ResumeStore:
             raise HTTPException(status_code=404, detail='Resume file not found.')
 
         try:
-            obj = self.s3.get_object(Bucket=self.bucket_name, Key=requested_key)
+            return self.s3.generate_presigned_url(
+                'get_object',
+                Params={
+                    'Bucket': self.bucket_name,
+                    'Key': requested_key,
+                    'ResponseContentType': 'application/pdf',
+                    'ResponseContentDisposition': f'attachment; filename="{stored_filename}"',
+                },
+                ExpiresIn=expires,
+            )
         except (ClientError, BotoCoreError) as exc:
-            raise HTTPException(status_code=404, detail='Resume file not found.') from exc
-
-        body = obj.get('Body')
-        if body is None:
-            raise HTTPException(status_code=500, detail='Invalid resume file response.')
-
-        return body
+            raise HTTPException(status_code=500, detail='Failed to create resume download URL.') from exc
 
 
 class LocalResumeStore:
@@ -115,22 +356,49 @@ class LocalResumeStore:
         self.storage_dir = Path('local_resumes')
         self.storage_dir.mkdir(exist_ok=True)
         self.metadata_file = self.storage_dir / 'metadata.json'
+        self.metadata_log = self.storage_dir / 'metadata.log'
+        self._lock = threading.Lock()
+        self._dirs: Set[str] = set()  # 이미 생성된 학생 디렉터리
         self._metadata: Dict[str, Dict[str, Any]] = self._load_metadata()
     
     def _load_metadata(self) -> Dict[str, Dict[str, Any]]:
-        """메타데이터 파일 로드"""
+        """스냅샷(metadata.json) 로드 후 추가 로그(metadata.log)를 재생"""
+        metadata: Dict[str, Dict[str, Any]] = {}
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                metadata = orjson.loads(self.metadata_file.read_bytes())
             except Exception:
-                return {}
-        return {}
+                metadata = {}
+        if self.metadata_log.exists():
+            data = self.metadata_log.read_bytes()
+            end = data.rfind(b'\n') + 1
+            if end != len(data):
+                # 기록 중 중단된 마지막 줄을 잘라내 이후 추가되는 기록이 그 뒤에 이어붙지 않도록 함
+                with open(self.metadata_log, 'r+b') as f:
+                    f.truncate(end)
+            for line in data[:end].splitlines():
+                try:
+                    item = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                metadata[item['studentId']] = item
+        return metadata
     
-    def _save_metadata(self) -> None:
-        """메타데이터 파일 저장"""
-        with open(self.metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(self._metadata, f, ensure_ascii=False, indent=2)
+    def _append_metadata(self, item: Dict[str, Any]) -> None:
+        """변경된 항목 하나만 로그에 추가 (self._lock 보유 상태에서 호출)"""
+        with open(self.metadata_log, 'ab') as f:
+            f.write(orjson.dumps(item) + b'\n')
+            f.flush()
+            size = f.tell()
+        if size > METADATA_LOG_COMPACT_BYTES:
+            self._compact_metadata()
+    
+    def _compact_metadata(self) -> None:
+        """메모리 인덱스를 스냅샷으로 저장하고 로그를 비움"""
+        tmp_file = self.metadata_file.with_suffix('.json.tmp')
+        tmp_file.write_bytes(orjson.dumps(self._metadata))
+        os.replace(tmp_file, self.metadata_file)
+        self.metadata_log.unlink(missing_ok=True)
     
     def _build_download_url(self, student_id: str, stored_filename: str) -> str:
         return f"/api/resume-files/{student_id}/{stored_filename}"
@@ -138,26 +406,28 @@ class LocalResumeStore:
     def _get_storage_path(self, student_id: str, stored_filename: str) -> Path:
         """로컬 파일 경로 생성"""
         student_dir = self.storage_dir / student_id
-        student_dir.mkdir(exist_ok=True)
+        if student_id not in self._dirs:
+            student_dir.mkdir(parents=True, exist_ok=True)
+            self._dirs.add(student_id)
         return student_dir / stored_filename
     
     def save_resume(
         self,
         student_id: str,
         filename: str,
-        content: bytes,
+        fileobj: BinaryIO,
         meta: Optional[Dict[str, object]] = None,
     ) -> Dict[str, Any]:
         if not filename.lower().endswith('.pdf'):
             raise HTTPException(status_code=400, detail='Only PDF uploads are allowed.')
         
-        resume_id = uuid4().hex
+        resume_id = _new_resume_id()
         stored_filename = f"{resume_id}.pdf"
-        storage_path = self._get_storage_path(student_id, stored_filename)
+        storage_path = self._get_storage_path(student_id, f"{stored_filename}.gz")
         
-        # 파일 저장
+        # 파일 저장 (청크 단위 gzip 압축)
         with open(storage_path, 'wb') as f:
-            f.write(content)
+            _gzip_copy(fileobj, f)
         
         # 메타데이터 저장
         item: Dict[str, Any] = {
@@ -166,24 +436,33 @@ class LocalResumeStore:
             'fileName': filename,
             'url': self._build_download_url(student_id, stored_filename),
             'storageKey': f"{student_id}/{stored_filename}",
-            'uploadedAt': datetime.now(timezone.utc).isoformat(),
+            'uploadedAt': _utc_timestamp(),
         }
         if meta:
             item['meta'] = meta
         
-        self._metadata[student_id] = item
-        self._save_metadata()
+        with self._lock:
+            self._metadata[student_id] = item
+            self._append_metadata(item)
         
-        return {k: item.get(k) for k in ('resumeId', 'fileName', 'url', 'meta') if item.get(k) is not None}
+        return _to_record(item)
     
     def get_resume(self, student_id: str) -> Dict[str, Any]:
         item = self._metadata.get(student_id)
         if not item:
             raise HTTPException(status_code=404, detail='Resume not found for this student.')
-        return {k: item.get(k) for k in ('resumeId', 'fileName', 'url', 'meta') if item.get(k) is not None}
+        return _to_record(item)
+    
+    def is_current_file(self, student_id: str, stored_filename: str) -> bool:
+        """요청한 파일이 학생의 현재 이력서인지 메모리 인덱스로만 확인 (디스크 I/O 없음)"""
+        item = self._metadata.get(student_id)
+        return item is not None and item.get('storageKey') == f"{student_id}/{stored_filename}"
     
     def get_resume_stream(self, student_id: str, stored_filename: str) -> Path:
-        """로컬 파일 경로 반환 (FileResponse에서 사용)"""
+        """로컬 파일 경로 반환 (FileResponse에서 사용)
+
+        gzip으로 저장된 파일은 `.gz` 경로를 반환하며, 압축 이전에 저장된 파일은 원본 경로를 반환
+        """
         item = self._metadata.get(student_id)
         if not item:
             raise HTTPException(status_code=404, detail='Resume not found for this student.')
@@ -194,6 +473,10 @@ class LocalResumeStore:
         if expected_key != requested_key:
             raise HTTPException(status_code=404, detail='Resume file not found.')
         
+        storage_path = self._get_storage_path(student_id, f"{stored_filename}.gz")
+        if storage_path.exists():
+            return storage_path
+        
         storage_path = self._get_storage_path(student_id, stored_filename)
         if not storage_path.exists():
             raise HTTPException(status_code=404, detail='Resume file not found.')
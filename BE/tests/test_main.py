@@ -0,0 +1,142 @@
+import gzip
+import io
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from src import storage
+from src.main import MAX_META_BYTES, MOCK_SCHOLARSHIPS, Scholarship, app, get_resume_store
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    # AWS 없이 로컬 저장소만 사용
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(storage, '_LOCAL_RESUME_STORE', None)
+    app.dependency_overrides[get_resume_store] = lambda: None
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def _upload(client, student_id, content=b'%PDF-1.4 body', meta=None):
+    data = {'meta': meta} if meta is not None else {}
+    return client.post(
+        f'/api/students/{student_id}/resume',
+        files={'file': ('cv.pdf', content, 'application/pdf')},
+        data=data,
+    )
+
+
+def test_download_returns_304_for_current_resume_etag(client):
+    url = _upload(client, 's1').json()['url']
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.headers['cache-control'] == 'private, max-age=31536000, immutable'
+
+    response = client.get(url, headers={'If-None-Match': response.headers['etag']})
+    assert response.status_code == 304
+
+
+def test_download_does_not_return_304_for_other_student_or_superseded_file(client):
+    old_url = _upload(client, 's1').json()['url']
+    _upload(client, 's1')
+    stored_filename = old_url.rsplit('/', 1)[1]
+    etag = f'"{stored_filename.split(".", 1)[0]}"'
+
+    assert client.get(old_url, headers={'If-None-Match': etag}).status_code == 404
+    response = client.get(f'/api/resume-files/anyone/{stored_filename}', headers={'If-None-Match': etag})
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize('accept_encoding', ['gzip, deflate', 'br;q=1.0, gzip;q=0.5'])
+def test_download_sends_gzip_when_accepted(client, accept_encoding):
+    url = _upload(client, 's1').json()['url']
+
+    with client.stream('GET', url, headers={'Accept-Encoding': accept_encoding}) as response:
+        raw = b''.join(response.iter_raw())
+
+    assert response.headers['content-encoding'] == 'gzip'
+    assert response.headers['vary'] == 'Accept-Encoding'
+    assert gzip.decompress(raw) == b'%PDF-1.4 body'
+
+
+@pytest.mark.parametrize('accept_encoding', ['identity', 'gzip;q=0', ''])
+def test_download_decompresses_when_gzip_not_accepted(client, accept_encoding):
+    url = _upload(client, 's1').json()['url']
+
+    with client.stream('GET', url, headers={'Accept-Encoding': accept_encoding}) as response:
+        raw = b''.join(response.iter_raw())
+
+    assert 'content-encoding' not in response.headers
+    assert response.headers['vary'] == 'Accept-Encoding'
+    assert raw == b'%PDF-1.4 body'
+
+
+@pytest.mark.parametrize(
+    'content, detail',
+    [
+        (b'hello world', 'Uploaded file is not a valid PDF.'),
+        (b'', 'Uploaded file is empty.'),
+    ],
+)
+def test_upload_rejects_non_pdf_body_without_storing(client, content, detail):
+    _upload(client, 's1')
+    log = storage.get_local_resume_store().metadata_log
+    before = log.read_bytes()
+
+    response = _upload(client, 's2', content=content)
+
+    assert response.status_code == 400
+    assert response.json()['detail'] == detail
+    assert log.read_bytes() == before
+    assert not (log.parent / 's2').exists()
+
+
+@pytest.mark.parametrize('category', [None, 'scholarship', 'competition'])
+def test_scholarship_list_matches_models(client, category):
+    params = {'category': category} if category else {}
+    response = client.get('/api/scholarships', params=params)
+
+    expected = [s for s in MOCK_SCHOLARSHIPS if category is None or s.category == category]
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/json'
+    assert orjson.loads(response.content) == [s.model_dump() for s in expected]
+    # response_model 계약: 응답이 Scholarship 모델로 다시 검증되어야 함
+    assert [Scholarship.model_validate(s) for s in response.json()] == expected
+
+
+def test_scholarship_list_rejects_invalid_category(client):
+    response = client.get('/api/scholarships', params={'category': 'unknown'})
+    assert response.status_code == 400
+
+
+def test_scholarship_detail_matches_model(client):
+    for scholarship in MOCK_SCHOLARSHIPS:
+        response = client.get(f'/api/scholarships/{scholarship.id}')
+        assert response.status_code == 200
+        assert orjson.loads(response.content) == scholarship.model_dump()
+
+    assert client.get('/api/scholarships/missing').status_code == 404
+
+
+@pytest.mark.parametrize('meta', ['[1]', 'null', '"text"', '3'])
+def test_upload_rejects_non_object_meta(client, meta):
+    response = _upload(client, 's1', meta=meta)
+    assert response.status_code == 400
+    assert response.json()['detail'] == '`meta` must be a JSON object.'
+
+
+def test_upload_limits_meta_size_in_bytes(client):
+    # 글자 수로는 한도 이내지만 UTF-8 바이트 수(글자당 3바이트)로는 초과
+    text = '한' * (MAX_META_BYTES // 3)
+    meta = orjson.dumps({'note': text}).decode()
+    assert len(meta) <= MAX_META_BYTES < len(meta.encode())
+
+    assert _upload(client, 's1', meta=meta).status_code == 413
+
+    meta = orjson.dumps({'note': '한' * (MAX_META_BYTES // 3 - 10)}).decode()
+    response = _upload(client, 's1', meta=meta)
+    assert response.status_code == 200
+    assert response.json()['meta']['source'] == 'upload'
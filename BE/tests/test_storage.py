@@ -0,0 +1,215 @@
+import gzip
+import io
+import random
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+from botocore.exceptions import ClientError
+from fastapi import HTTPException
+
+from src.storage import COPY_CHUNK_SIZE, LocalResumeStore, ResumeStore, _DynamoTable, _GzipStream, _format_utc_timestamp
+
+
+def _client_error(code: str, operation: str) -> ClientError:
+    return ClientError({'Error': {'Code': code, 'Message': code}}, operation)
+
+
+class FakeS3:
+    def __init__(self, fail_upload: bool = False) -> None:
+        self.objects: Dict[str, bytes] = {}
+        self.fail_upload = fail_upload
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None, Config=None) -> None:
+        data = fileobj.read()
+        if self.fail_upload:
+            raise _client_error('InternalError', 'PutObject')
+        self.objects[key] = data
+
+    def delete_object(self, Bucket, Key) -> None:
+        self.objects.pop(Key, None)
+
+
+class FakeTable:
+    def __init__(self, s3: FakeS3, items: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        self.s3 = s3
+        self.items: Dict[str, Dict[str, Any]] = items or {}
+        self.before_put = None
+
+    def get_item(self, Key, ProjectionExpression=None, ConsistentRead=False):
+        item = self.items.get(Key['studentId'])
+        return {'Item': dict(item)} if item else {}
+
+    def put_item(self, Item, ConditionExpression=None, ExpressionAttributeValues=None) -> None:
+        # 메타데이터가 보이는 시점에는 객체가 이미 존재해야 함
+        assert Item['storageKey'] in self.s3.objects
+        if self.before_put:
+            self.before_put()
+        existing = self.items.get(Item['studentId'])
+        if existing is not None:
+            old = (ExpressionAttributeValues or {}).get(':old')
+            if existing['resumeId'] != old:
+                raise _client_error('ConditionalCheckFailedException', 'PutItem')
+        self.items[Item['studentId']] = Item
+
+
+def _make_store(s3: FakeS3, table: FakeTable) -> ResumeStore:
+    store = ResumeStore.__new__(ResumeStore)
+    store.bucket_name = 'bucket'
+    store.s3 = s3
+    store.table = table
+    return store
+
+
+def test_save_resume_writes_metadata_after_upload():
+    s3 = FakeS3()
+    table = FakeTable(s3, {'s1': {'studentId': 's1', 'resumeId': 'OLD', 'storageKey': 's1/OLD.pdf'}})
+    store = _make_store(s3, table)
+
+    record = store.save_resume('s1', 'cv.pdf', io.BytesIO(b'%PDF-1.4 body'))
+
+    item = table.items['s1']
+    assert item['resumeId'] == record['resumeId']
+    assert gzip.decompress(s3.objects[item['storageKey']]) == b'%PDF-1.4 body'
+
+
+def test_failed_upload_keeps_previous_resume():
+    s3 = FakeS3(fail_upload=True)
+    previous = {'studentId': 's1', 'resumeId': 'OLD', 'storageKey': 's1/OLD.pdf'}
+    table = FakeTable(s3, {'s1': dict(previous)})
+    store = _make_store(s3, table)
+
+    with pytest.raises(HTTPException) as exc_info:
+        store.save_resume('s1', 'cv.pdf', io.BytesIO(b'%PDF-1.4 body'))
+
+    assert exc_info.value.status_code == 500
+    assert table.items['s1'] == previous
+    assert s3.objects == {}
+
+
+def test_concurrent_overwrite_returns_conflict_and_removes_object():
+    s3 = FakeS3()
+    table = FakeTable(s3, {'s1': {'studentId': 's1', 'resumeId': 'OLD', 'storageKey': 's1/OLD.pdf'}})
+    store = _make_store(s3, table)
+
+    def other_upload_wins() -> None:
+        table.items['s1'] = {'studentId': 's1', 'resumeId': 'OTHER', 'storageKey': 's1/OTHER.pdf'}
+
+    table.before_put = other_upload_wins
+
+    with pytest.raises(HTTPException) as exc_info:
+        store.save_resume('s1', 'cv.pdf', io.BytesIO(b'%PDF-1.4 body'))
+
+    assert exc_info.value.status_code == 409
+    assert table.items['s1']['resumeId'] == 'OTHER'
+    assert s3.objects == {}
+
+
+def test_conflict_is_reported_even_if_cleanup_fails():
+    s3 = FakeS3()
+    table = FakeTable(s3, {'s1': {'studentId': 's1', 'resumeId': 'OLD', 'storageKey': 's1/OLD.pdf'}})
+    store = _make_store(s3, table)
+
+    def other_upload_wins() -> None:
+        table.items['s1'] = {'studentId': 's1', 'resumeId': 'OTHER', 'storageKey': 's1/OTHER.pdf'}
+
+    def broken_delete(Bucket, Key) -> None:
+        raise RuntimeError('cleanup failed')
+
+    table.before_put = other_upload_wins
+    s3.delete_object = broken_delete
+
+    with pytest.raises(HTTPException) as exc_info:
+        store.save_resume('s1', 'cv.pdf', io.BytesIO(b'%PDF-1.4 body'))
+
+    assert exc_info.value.status_code == 409
+
+
+def test_closed_upload_file_is_reported_as_upload_failure():
+    s3 = FakeS3()
+    table = FakeTable(s3)
+    store = _make_store(s3, table)
+    fileobj = io.BytesIO(b'%PDF-1.4 body')
+    fileobj.close()
+
+    with pytest.raises(HTTPException) as exc_info:
+        store.save_resume('s1', 'cv.pdf', fileobj)
+
+    assert exc_info.value.status_code == 500
+    assert table.items == {}
+
+
+def test_gzip_stream_compresses_incrementally():
+    payload = b'%PDF-1.4 ' + bytes(range(256)) * (3 * COPY_CHUNK_SIZE // 256)
+    stream = _GzipStream(io.BytesIO(payload))
+
+    parts = []
+    while True:
+        part = stream.read(64 * 1024)
+        if not part:
+            break
+        assert len(part) <= 64 * 1024
+        parts.append(part)
+
+    assert not stream.seekable()
+    assert gzip.decompress(b''.join(parts)) == payload
+
+
+def test_local_metadata_log_recovers_from_torn_last_line(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    store = LocalResumeStore()
+    store.save_resume('s1', 'a.pdf', io.BytesIO(b'%PDF-1.4 a'))
+    with open(store.metadata_log, 'ab') as f:
+        f.write(b'{"studentId": "s2", "resu')
+
+    store = LocalResumeStore()
+    record = store.save_resume('s3', 'c.pdf', io.BytesIO(b'%PDF-1.4 c'))
+
+    store = LocalResumeStore()
+    assert store.get_resume('s1')['fileName'] == 'a.pdf'
+    assert store.get_resume('s3') == record
+
+
+def test_dynamo_table_converts_values_for_low_level_client():
+    client = boto3.session.Session(region_name='us-east-1').client(
+        'dynamodb', aws_access_key_id='x', aws_secret_access_key='x'
+    )
+    table = _DynamoTable(client, 'Resumes')
+
+    with Stubber(client) as stubber:
+        stubber.add_response(
+            'put_item',
+            {},
+            {
+                'TableName': 'Resumes',
+                'Item': {'studentId': {'S': 's1'}, 'meta': {'M': {'tags': {'L': [{'S': 'a'}]}}}},
+                'ConditionExpression': 'resumeId = :old',
+                'ExpressionAttributeValues': {':old': {'S': 'OLD'}},
+            },
+        )
+        stubber.add_response(
+            'get_item',
+            {'Item': {'studentId': {'S': 's1'}, 'meta': {'M': {'tags': {'L': [{'S': 'a'}]}}}}},
+            {'TableName': 'Resumes', 'Key': {'studentId': {'S': 's1'}}, 'ConsistentRead': True},
+        )
+
+        table.put_item(
+            Item={'studentId': 's1', 'meta': {'tags': ['a']}},
+            ConditionExpression='resumeId = :old',
+            ExpressionAttributeValues={':old': 'OLD'},
+        )
+        response = table.get_item(Key={'studentId': 's1'}, ConsistentRead=True)
+
+    assert response['Item'] == {'studentId': 's1', 'meta': {'tags': ['a']}}
+
+
+def test_utc_timestamp_matches_datetime_isoformat():
+    base = 1_763_846_556.0
+    samples = [base, base + 0.5, base + 0.0000005, base + 0.0000015, base + 0.9999996, base + 0.259797]
+    rng = random.Random(0)
+    samples += [base + rng.random() * 86_400 for _ in range(10_000)]
+
+    for now in samples:
+        assert _format_utc_timestamp(now) == datetime.fromtimestamp(now, timezone.utc).isoformat()